@@ -1,20 +1,58 @@
 # app.py
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, Response, render_template, request, send_file, jsonify
+from flask.json.provider import JSONProvider
 import re
 import os
+import secrets
+import stat
 import tempfile
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 import logging
-from werkzeug.utils import secure_filename
+import orjson
+from streaming_form_data import StreamingFormDataParser, ParseFailedException
+from streaming_form_data.targets import FileTarget
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from config_loader import ConfigLoader
 from csv_processor import CSVProcessor
 from kotlin_generator import KotlinGenerator
 from models import Config
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, whose C encoder handles the large preview strings much faster"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['UPLOAD_FOLDER'] = 'temp_uploads'
+# Hand file downloads to a fronting proxy (nginx/Apache) via X-Sendfile so they
+# are sent with sendfile(2); only enable this when such a proxy is in place
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+# Uploaded CSVs (written, read once and deleted) and generated results are
+# short-lived, so keep them on RAM-backed tmpfs when it is available;
+# CSV_TMPDIR overrides the location
+app.config['UPLOAD_FOLDER'] = os.environ.get(
+    'CSV_TMPDIR',
+    os.path.join('/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(), 'csv_uploads')
+)
+
+# Read size used when streaming the multipart upload body to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# How long a generated result stays available, how long an upload left behind
+# by an aborted request is kept, and how often the janitor cleans both up
+RESULT_TTL_SECONDS = 60 * 60
+UPLOAD_TTL_SECONDS = 60 * 60
+JANITOR_INTERVAL_SECONDS = 5 * 60
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -23,28 +61,123 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def _split_kotlin_into_chunks(content: str, max_per_chunk: int = 150):
+# Marker that starts every generated entry; a plain substring, so str.find is enough
+_ENTRY_MARKER = "CategoryLaunchDataProviderModel("
+# Closing pattern at the end of the file: closing parenthesis for arrayOf,
+# then function closing brace, then class closing brace
+_FOOTER_RE = re.compile(r'^\s+\)\s*\n\s+\}\s*\n\s*\}\s*$', re.MULTILINE)
+
+# Uploaded CSVs are named upload-*.csv, so the janitor only ever removes files
+# this app created, even when CSV_TMPDIR points at a shared directory
+_UPLOAD_PREFIX = 'upload-'
+_UPLOAD_SUFFIX = '.csv'
+
+# Generated Kotlin per upload is kept as a file in UPLOAD_FOLDER, named after
+# the token returned from /upload, so memory use does not grow with the number
+# of results and any worker process can serve them
+_RESULT_PREFIX = 'result-'
+_RESULT_SUFFIX = '.kt'
+# Tokens come from secrets.token_urlsafe; anything else cannot name a result
+_TOKEN_RE = re.compile(r'[A-Za-z0-9_-]+')
+# The first /preview of a result also writes its JSON body next to the result
+# file, and later previews are served from there
+_PREVIEW_SUFFIX = '.preview.json'
+
+def _result_path(token: str) -> Path:
+    """Path of the generated Kotlin file for a token"""
+    return Path(app.config['UPLOAD_FOLDER']) / f'{_RESULT_PREFIX}{token}{_RESULT_SUFFIX}'
+
+def _preview_path(token: str) -> Path:
+    """Path of the cached /preview body for a token"""
+    return Path(app.config['UPLOAD_FOLDER']) / f'{_RESULT_PREFIX}{token}{_PREVIEW_SUFFIX}'
+
+def _get_result(token: str) -> Optional[Path]:
+    """Look up a generated result file by its token"""
+    if not _TOKEN_RE.fullmatch(token):
+        return None
+    path = _result_path(token)
+    return path if path.is_file() else None
+
+def _remove_files_older_than(pattern: str, cutoff: float) -> int:
+    """Delete the regular files in UPLOAD_FOLDER matching pattern that were last modified before cutoff"""
+    removed = 0
+    for path in Path(app.config['UPLOAD_FOLDER']).glob(pattern):
+        try:
+            st = path.lstat()
+            if stat.S_ISREG(st.st_mode) and st.st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            # Already removed by the request that created it
+            continue
+        except OSError as e:
+            # Skip just this entry so the rest of the sweep still runs
+            logger.warning("Janitor could not remove %s: %s", path, e)
+    return removed
+
+def _evict_expired_results() -> int:
+    """Delete generated results older than RESULT_TTL_SECONDS, with their cached previews"""
+    cutoff = time.time() - RESULT_TTL_SECONDS
+    evicted = _remove_files_older_than(f'{_RESULT_PREFIX}*{_RESULT_SUFFIX}', cutoff)
+    # A preview is written after its result, so it goes once the result is gone
+    # rather than by its own age; leftover .tmp parts expire by age
+    for path in Path(app.config['UPLOAD_FOLDER']).glob(f'{_RESULT_PREFIX}*{_PREVIEW_SUFFIX}'):
+        token = path.name[len(_RESULT_PREFIX):-len(_PREVIEW_SUFFIX)]
+        if _result_path(token).exists() or not path.is_file():
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning("Janitor could not remove %s: %s", path, e)
+    _remove_files_older_than(f'{_RESULT_PREFIX}*.tmp', cutoff)
+    return evicted
+
+def _remove_stale_uploads() -> int:
+    """Delete uploaded CSVs older than UPLOAD_TTL_SECONDS"""
+    return _remove_files_older_than(f'{_UPLOAD_PREFIX}*{_UPLOAD_SUFFIX}', time.time() - UPLOAD_TTL_SECONDS)
+
+def _janitor() -> None:
+    """Periodically clean up expired results and stale uploads in the background"""
+    while True:
+        time.sleep(JANITOR_INTERVAL_SECONDS)
+        try:
+            evicted = _evict_expired_results()
+            removed = _remove_stale_uploads()
+            if evicted or removed:
+                logger.info("Janitor evicted %d result files and removed %d stale uploads", evicted, removed)
+        except Exception as e:
+            logger.error("Janitor run failed: %s", e)
+
+threading.Thread(target=_janitor, daemon=True).start()
+
+def _iter_kotlin_chunks(content: str, max_per_chunk: int = 150):
     """Split generated Kotlin into chunks by CategoryLaunchDataProviderModel entries.
 
     We detect each entry by occurrences of 'CategoryLaunchDataProviderModel(' and group
-    up to max_per_chunk entries per returned chunk. Any header text (if present) is
+    up to max_per_chunk entries per yielded chunk. Any header text (if present) is
     included at the beginning of the first chunk, and footer is added to every chunk.
+    Chunks are sliced out of content one at a time, as the caller consumes them.
     """
     try:
         # Find positions of each entry start
-        pattern = r"CategoryLaunchDataProviderModel\("
-        positions = [m.start() for m in re.finditer(pattern, content)]
+        positions = []
+        pos = content.find(_ENTRY_MARKER)
+        while pos >= 0:
+            positions.append(pos)
+            pos = content.find(_ENTRY_MARKER, pos + len(_ENTRY_MARKER))
 
         if not positions:
-            return [content] if content.strip() else []
+            if content.strip():
+                yield content
+            return
 
         # Split content into header (before first entry), entry blocks, and footer (after last entry)
         header = content[:positions[0]]
         
         # Extract footer - look for the closing pattern at the end: "        )\n    }\n}"
-        # The footer pattern is: closing parenthesis for arrayOf, then function closing brace, then class closing brace
-        footer_pattern = r'^\s+\)\s*\n\s+\}\s*\n\s*\}\s*$'
-        footer_match = re.search(footer_pattern, content, re.MULTILINE)
+        footer_match = _FOOTER_RE.search(content)
         if footer_match:
             footer = content[footer_match.start():].strip()
             # Content without footer ends before footer starts
@@ -53,33 +186,93 @@ def _split_kotlin_into_chunks(content: str, max_per_chunk: int = 150):
             footer = ""
             content_without_footer = content
         
-        # Extract each entry by slicing between start positions
         # Adjust positions to be relative to content_without_footer
         positions_in_content = [pos for pos in positions if pos < len(content_without_footer)]
         if not positions_in_content:
             positions_in_content = positions
-        
-        entries = []
-        for i, start in enumerate(positions_in_content):
-            if i + 1 < len(positions_in_content):
-                end = positions_in_content[i + 1]
-            else:
-                end = len(content_without_footer)
-            entries.append(content_without_footer[start:end].strip())
-
-        # Group entries into chunks
-        chunks = []
+
         header_text = header.strip() + "\n\n" if header.strip() else ""
         footer_text = "\n" + footer if footer else ""
-        for i in range(0, len(entries), max_per_chunk):
-            group = entries[i:i + max_per_chunk]
-            chunk_body = "\n\n".join(group)
-            # Add header and footer to every chunk
-            chunks.append((header_text + chunk_body + footer_text).strip())
-        return chunks
     except Exception as e:
-        logger.error(f"Failed to split preview content: {e}")
-        return [content]
+        logger.error("Failed to split preview content: %s", e)
+        yield content
+        return
+
+    # Group entries into chunks. Consecutive entries are already separated by a
+    # blank line, so each chunk body is one slice from its first entry's start
+    # to the next chunk's start (or the end of the content)
+    entry_count = len(positions_in_content)
+    for i in range(0, entry_count, max_per_chunk):
+        start = positions_in_content[i]
+        end = positions_in_content[i + max_per_chunk] if i + max_per_chunk < entry_count else len(content_without_footer)
+        chunk_body = content_without_footer[start:end].rstrip()
+        # Add header and footer to every chunk
+        yield header_text + chunk_body + footer_text
+
+# Column names and mappings used for uploaded CSVs; built once and read-only,
+# since every upload uses the same values
+_COLUMNS_MAP = MappingProxyType({
+    'leaf': 'Leaf',
+    'category_id': 'ID',
+    'level': 'Level',
+    'path': 'Path',
+    'brand': 'Brand',
+    'colour': 'Colour',
+    'material': 'Material',
+    'pattern': 'Pattern',
+    'size': 'Size',
+    'size_group': 'Size group',
+    'author': 'Author',
+    'title': 'Title',
+    'isbn': 'ISBN',
+    'language_book': 'Language Book',
+    'video_game_rating': 'Video Game Rating',
+    'video_game_platform': 'Video Game Platform',
+    'internal_memory_capacity': 'Internal memory capacity',
+    'sim_lock': 'Sim Lock',
+    'package_size': 'All shippable',
+    'conditions': (
+        'New with tags',
+        'New without tags',
+        'Very good',
+        'Good',
+        'Satisfactory',
+        'Not fully functional'
+    )
+})
+
+_CONDITION_MAP = MappingProxyType({
+    "New with tags": "VintedConditionTypes.NEW_WITH_TAGS.id",
+    "New without tags": "VintedConditionTypes.NEW_WITHOUT_TAGS.id",
+    "Very good": "VintedConditionTypes.VERY_GOOD.id",
+    "Good": "VintedConditionTypes.GOOD.id",
+    "Satisfactory": "VintedConditionTypes.SATISFACTORY.id",
+    "Not fully functional": "VintedConditionTypes.NOT_FULLY_FUNCTIONAL.id"
+})
+
+_PACKAGE_MAP = MappingProxyType({
+    "All shippable": (
+        "VintedPackageTypes.SMALL.id",
+        "VintedPackageTypes.MEDIUM.id",
+        "VintedPackageTypes.LARGE.id"
+    ),
+    "Light bulky": (
+        "VintedPackageTypes.BULKY_SMALL.id",
+        "VintedPackageTypes.BULKY_MEDIUM.id",
+        "VintedPackageTypes.BULKY_LARGE.id",
+        "VintedPackageTypes.BULKY_X_LARGE.id"
+    ),
+    "Heavy": (
+        "VintedPackageTypes.HEAVY_SMALL.id",
+        "VintedPackageTypes.HEAVY_MEDIUM.id",
+        "VintedPackageTypes.HEAVY_LARGE.id"
+    ),
+    "Heavy bulky": (
+        "VintedPackageTypes.HEAVY_BULKY_SMALL.id",
+        "VintedPackageTypes.HEAVY_BULKY_MEDIUM.id",
+        "VintedPackageTypes.HEAVY_BULKY_LARGE.id"
+    )
+})
 
 def create_temp_config(csv_file_path: str) -> Config:
     """Create a temporary configuration for the uploaded CSV"""
@@ -87,67 +280,10 @@ def create_temp_config(csv_file_path: str) -> Config:
         csv_file_path=csv_file_path,
         csv_encoding="utf-8",
         delimiter=",",
-        columns={
-            'leaf': 'Leaf',
-            'category_id': 'ID',
-            'level': 'Level',
-            'path': 'Path',
-            'brand': 'Brand',
-            'colour': 'Colour',
-            'material': 'Material',
-            'pattern': 'Pattern',
-            'size': 'Size',
-            'size_group': 'Size group',
-            'author': 'Author',
-            'title': 'Title',
-            'isbn': 'ISBN',
-            'language_book': 'Language Book',
-            'video_game_rating': 'Video Game Rating',
-            'video_game_platform': 'Video Game Platform',
-            'internal_memory_capacity': 'Internal memory capacity',
-            'sim_lock': 'Sim Lock',
-            'package_size': 'All shippable',
-            'conditions': [
-                'New with tags',
-                'New without tags',
-                'Very good',
-                'Good',
-                'Satisfactory',
-                'Not fully functional'
-            ]
-        },
+        columns=_COLUMNS_MAP,
         output_kotlin_file="temp_output.kt",
-        condition_mapping={
-            "New with tags": "VintedConditionTypes.NEW_WITH_TAGS.id",
-            "New without tags": "VintedConditionTypes.NEW_WITHOUT_TAGS.id",
-            "Very good": "VintedConditionTypes.VERY_GOOD.id",
-            "Good": "VintedConditionTypes.GOOD.id",
-            "Satisfactory": "VintedConditionTypes.SATISFACTORY.id",
-            "Not fully functional": "VintedConditionTypes.NOT_FULLY_FUNCTIONAL.id"
-        },
-        package_size_mapping={
-            "All shippable": [
-                "VintedPackageTypes.SMALL.id",
-                "VintedPackageTypes.MEDIUM.id",
-                "VintedPackageTypes.LARGE.id"
-            ],
-            "Light bulky": [
-                "VintedPackageTypes.BULKY_SMALL.id",
-                "VintedPackageTypes.BULKY_MEDIUM.id",
-                "VintedPackageTypes.BULKY_LARGE.id",
-                "VintedPackageTypes.BULKY_X_LARGE.id"
-            ],
-            "Heavy": [
-                "VintedPackageTypes.HEAVY_SMALL.id",
-                "VintedPackageTypes.HEAVY_MEDIUM.id",
-                "VintedPackageTypes.HEAVY_LARGE.id"
-            ],
-            "Heavy bulky": [
-                "VintedPackageTypes.HEAVY_BULKY_SMALL.id",
-                "VintedPackageTypes.HEAVY_BULKY_MEDIUM.id",
-                "VintedPackageTypes.HEAVY_BULKY_LARGE.id"
-            ]
-        }
+        condition_mapping=_CONDITION_MAP,
+        package_size_mapping=_PACKAGE_MAP
     )
 
 @app.route('/')
@@ -158,23 +294,41 @@ def index():
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """Handle CSV file upload and generate Kotlin"""
+    # Gunicorn hands the body over unread, so an oversized upload with a declared
+    # length is rejected before any of it is read from the socket or written to disk
+    max_length = app.config['MAX_CONTENT_LENGTH']
+    if request.content_length and request.content_length > max_length:
+        return jsonify({'error': f'File too large (max {max_length // (1024 * 1024)}MB)'}), 413
+    
     try:
-        if 'csv_file' not in request.files:
-            return jsonify({'error': 'No file uploaded'}), 400
-        
-        file = request.files['csv_file']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
-        
-        if not file.filename.lower().endswith('.csv'):
-            return jsonify({'error': 'Please upload a CSV file'}), 400
-        
-        # Save uploaded file temporarily
-        filename = secure_filename(file.filename)
-        temp_csv_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(temp_csv_path)
+        # Stream the multipart body straight into the temp file instead of
+        # letting Werkzeug spool it first and copying it again on save
+        fd, temp_csv_path = tempfile.mkstemp(prefix=_UPLOAD_PREFIX, suffix=_UPLOAD_SUFFIX, dir=app.config['UPLOAD_FOLDER'])
+        os.close(fd)
         
         try:
+            csv_target = FileTarget(temp_csv_path)
+            try:
+                parser = StreamingFormDataParser(headers=request.headers)
+                parser.register('csv_file', csv_target)
+                while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+                    parser.data_received(chunk)
+            except ParseFailedException:
+                return jsonify({'error': 'No file uploaded'}), 400
+            except RequestEntityTooLarge:
+                # Bodies without a declared length are cut off once they pass the limit
+                return jsonify({'error': f'File too large (max {max_length // (1024 * 1024)}MB)'}), 413
+            
+            filename = csv_target.multipart_filename
+            if filename is None:
+                return jsonify({'error': 'No file uploaded'}), 400
+            
+            if filename == '':
+                return jsonify({'error': 'No file selected'}), 400
+            
+            if not filename.lower().endswith('.csv'):
+                return jsonify({'error': 'Please upload a CSV file'}), 400
+
             # Create configuration
             config = create_temp_config(temp_csv_path)
             
@@ -185,67 +339,138 @@ def upload_file():
             if not categories:
                 return jsonify({'error': 'No leaf categories found in CSV'}), 400
             
-            # Generate Kotlin
+            # Generate Kotlin straight into this upload's result file
+            token = secrets.token_urlsafe(16)
             kotlin_generator = KotlinGenerator(config)
-            kotlin_content = kotlin_generator.generate_kotlin_models(categories)
-            
-            # Create temporary Kotlin file
-            temp_kotlin_path = os.path.join(app.config['UPLOAD_FOLDER'], 'generated_models.kt')
-            with open(temp_kotlin_path, 'w', encoding='utf-8') as f:
-                f.write(kotlin_content)
+            kotlin_generator.save_kotlin_file(categories, str(_result_path(token)))
             
             # Return success with file info
             return jsonify({
                 'success': True,
                 'message': f'Successfully processed {len(categories)} categories',
                 'categories_count': len(categories),
-                'download_url': '/download'
+                'download_url': f'/download/{token}',
+                'preview_url': f'/preview/{token}'
             })
             
         finally:
-            # Clean up temporary CSV file
-            if os.path.exists(temp_csv_path):
-                os.remove(temp_csv_path)
+            # Clean up temporary CSV file; anything missed here is left to the janitor
+            Path(temp_csv_path).unlink(missing_ok=True)
                 
     except Exception as e:
-        logger.error(f"Error processing file: {e}")
+        logger.error("Error processing file: %s", e)
         return jsonify({'error': f'Error processing file: {str(e)}'}), 500
 
-@app.route('/download')
-def download_kotlin():
+@app.route('/download/<token>')
+def download_kotlin(token):
     """Download the generated Kotlin file"""
     try:
-        kotlin_path = os.path.join(app.config['UPLOAD_FOLDER'], 'generated_models.kt')
-        if not os.path.exists(kotlin_path):
+        result_path = _get_result(token)
+        if result_path is None:
             return jsonify({'error': 'No generated file found'}), 404
         
+        # A token's content never changes, so it doubles as the ETag
         return send_file(
-            kotlin_path,
+            result_path,
             as_attachment=True,
             download_name='leaf_category_models.kt',
-            mimetype='text/plain'
+            mimetype='text/plain',
+            conditional=True,
+            etag=token,
+            max_age=0
         )
     except Exception as e:
-        logger.error(f"Error downloading file: {e}")
+        logger.error("Error downloading file: %s", e)
         return jsonify({'error': f'Error downloading file: {str(e)}'}), 500
 
-@app.route('/preview')
-def preview_kotlin():
+@app.route('/preview/<token>')
+def preview_kotlin(token):
     """Preview the generated Kotlin content"""
     try:
-        kotlin_path = os.path.join(app.config['UPLOAD_FOLDER'], 'generated_models.kt')
-        if not os.path.exists(kotlin_path):
+        result_path = _get_result(token)
+        if result_path is None:
             return jsonify({'error': 'No generated file found'}), 404
         
-        with open(kotlin_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # A token's content never changes, so it doubles as the ETag
+        if request.if_none_match.contains(token):
+            response = Response(status=304)
+            response.set_etag(token)
+            return response
+
+        preview_path = _preview_path(token)
+        if preview_path.is_file():
+            return send_file(preview_path, mimetype='application/json', etag=token, max_age=0)
 
-        # Split content into chunks of up to 150 CategoryLaunchDataProviderModel entries
-        chunks = _split_kotlin_into_chunks(content, max_per_chunk=150)
-        return jsonify({'chunks': chunks, 'total_chunks': len(chunks)})
+        content = result_path.read_text(encoding='utf-8')
+
+        def generate():
+            # Stream chunks of up to 150 CategoryLaunchDataProviderModel entries
+            # instead of building the whole chunk list and JSON body in memory.
+            # Each part is also written to a temp file that becomes the cached
+            # preview once complete; an aborted stream leaves no cache behind
+            fd, partial_path = tempfile.mkstemp(
+                prefix=f'{_RESULT_PREFIX}{token}.', suffix='.tmp', dir=app.config['UPLOAD_FOLDER']
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as cache:
+                    part = '{"chunks": ['
+                    cache.write(part)
+                    yield part
+                    total_chunks = 0
+                    for chunk in _iter_kotlin_chunks(content, max_per_chunk=150):
+                        part = app.json.dumps(chunk)
+                        if total_chunks:
+                            part = ', ' + part
+                        cache.write(part)
+                        yield part
+                        total_chunks += 1
+                    part = f'], "total_chunks": {total_chunks}}}'
+                    cache.write(part)
+                    yield part
+                os.replace(partial_path, preview_path)
+            finally:
+                Path(partial_path).unlink(missing_ok=True)
+
+        response = Response(generate(), mimetype='application/json')
+        response.set_etag(token)
+        return response
     except Exception as e:
-        logger.error(f"Error reading preview: {e}")
+        logger.error("Error reading preview: %s", e)
         return jsonify({'error': f'Error reading preview: {str(e)}'}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    try:
+        # Gunicorn needs fcntl and pwd, so it is only available on POSIX
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+
+    if BaseApplication is None:
+        # Windows: fall back to Werkzeug's threaded server
+        logger.warning("Gunicorn is not available, serving with the Werkzeug development server")
+        app.run(host='0.0.0.0', port=8080, threaded=True)
+    else:
+        class StandaloneApplication(BaseApplication):
+            """Gunicorn application that serves an already imported WSGI app"""
+
+            def __init__(self, application, options: Optional[dict] = None):
+                self.application = application
+                self.options = options or {}
+                super().__init__()
+
+            def load_config(self):
+                for key, value in self.options.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return self.application
+
+        # Gunicorn forks worker processes, each running requests on its own thread
+        # pool, so concurrent uploads run in parallel. Results and previews are files
+        # in UPLOAD_FOLDER, so any worker can serve any token
+        StandaloneApplication(app, {
+            'bind': '0.0.0.0:8080',
+            'workers': 4,
+            'worker_class': 'gthread',
+            'threads': 4,
+        }).run()
@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import Dict, Any
 from models import Config
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigLoader:
     @staticmethod
@@ -11,7 +17,7 @@ class ConfigLoader:
         """Load configuration from YAML file"""
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             return Config(
                 csv_file_path=data['csv']['file_path'],
@@ -1,253 +1,247 @@
 # csv_processor.py
 import csv
 import logging
+import sys
+from contextlib import closing
+from itertools import chain, count
 from pathlib import Path
-from typing import List, Dict, Optional
-from models import CategoryData, CategoryAttributes, Config, FieldTypeInfo
+from typing import List, Dict, Iterator, Optional, Tuple
+from models import CategoryData, CategoryAttributes, Config, FIELD_TYPE_NAMES
 
 logger = logging.getLogger(__name__)
 
+# Field mappings based on the CSV structure
+_FIELD_MAPPINGS = {
+    'brand': {'upload_form': True, 'filter': True},      # Upload Form + Filters
+    'colour': {'upload_form': True, 'filter': True},     # Upload Form + Filters  
+    'material': {'upload_form': True, 'filter': True},   # Upload Form + Filters
+    'pattern': {'upload_form': False, 'filter': True},   # Filters Only
+    'size': {'upload_form': True, 'filter': True},       # Upload Form + Filters
+    'size_group': {'upload_form': True, 'filter': True}, # Upload Form + Filters
+    'author': {'upload_form': True, 'filter': False},    # Upload Form Only
+    'title': {'upload_form': True, 'filter': False},     # Upload Form Only
+    'isbn': {'upload_form': True, 'filter': False},      # Upload Form Only
+    'language_book': {'upload_form': False, 'filter': True},  # Filters Only
+    'video_game_rating': {'upload_form': True, 'filter': True},  # Upload Form + Filters
+    'video_game_platform': {'upload_form': True, 'filter': True},  # Upload Form + Filters
+    'internal_memory_capacity': {'upload_form': True, 'filter': True},  # Upload Form + Filters
+    'sim_lock': {'upload_form': True, 'filter': True},  # Upload Form + Filters
+}
+
+# CategoryAttributes fields in declaration order, with the column name used when
+# the config doesn't name one, and whether the cell is read as a plain flag
+# (TRUE/1 -> True, anything else -> None) or kept as its text when not TRUE/empty
+_ATTRIBUTE_COLUMNS = (
+    ('brand', None, False),
+    ('colour', None, False),
+    ('material', None, False),
+    ('pattern', 'Pattern', False),
+    ('size', 'Size', True),
+    ('size_group', None, False),
+    ('author', None, False),
+    ('title', None, False),
+    ('isbn', None, False),
+    ('language_book', 'Language Book', True),
+    ('video_game_rating', 'Video Game Rating', True),
+    ('video_game_platform', 'Video Game Platform', True),
+    ('internal_memory_capacity', 'Internal memory capacity', True),
+    ('sim_lock', 'Sim Lock', True),
+)
+
+# Attribute cells that map to a fixed value; any other text is kept as-is
+_ATTR_MAP = {'TRUE': True, '': None}
+
+# Field columns that are required when the config names them
+_OPTIONAL_REQUIRED_FIELDS = (
+    'material', 'pattern', 'size', 'size_group', 'author', 'title', 'isbn',
+    'language_book', 'video_game_rating', 'video_game_platform',
+    'internal_memory_capacity', 'sim_lock',
+)
+
+# Boolean package size columns in order of preference, with the package type each maps to
+_PACKAGE_SIZE_COLUMNS = (
+    ('All shippable', 'All shippable'),
+    ('Heavy shipping', 'Heavy'),
+    ('Light bulky', 'Light bulky'),
+    ('Heavy bulky', 'Heavy bulky'),
+)
+
+# Exact spellings that settle a boolean cell without stripping or upper-casing it
+_TRUE_VALUES = frozenset({'TRUE', 'True', 'true'})
+_FALSE_VALUES = frozenset({'FALSE', 'False', 'false', ''})
+
+
+def _is_true(value: str) -> bool:
+    """Check a boolean cell for TRUE, ignoring case and surrounding whitespace"""
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return value.strip().upper() == 'TRUE'
+
+# Column names that identify the header row, which follows a category preamble
+_HEADER_COLUMNS = frozenset({'ID', 'Code', 'Name', 'Path', 'Level', 'Leaf'})
+
+# Large read buffer so the reader pulls the file in few system calls
+_READ_BUFFER_SIZE = 1 << 20
+
+
+def _try_int(value: str) -> Optional[int]:
+    """Parse an integer cell, returning None when it is not a valid integer"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
 
 class CSVProcessor:
     def __init__(self, config: Config):
         self.config = config
         self._column_indices: Dict[str, int] = {}
 
-    def _find_header_row(self, csv_data: List[List[str]]) -> int:
-        """Find the row that contains the actual column headers"""
+        # Columns every CSV must have; the optional field and package_size
+        # columns are required only when the config names them
+        columns = config.columns
+        self._required_columns = (
+            columns['leaf'],
+            columns['category_id'],
+            columns['path'],
+            columns['brand'],
+            columns['colour'],
+            columns['level'],
+            *(columns[col] for col in _OPTIONAL_REQUIRED_FIELDS if col in columns),
+            *((columns['package_size'],) if 'package_size' in columns else ()),
+        )
+
+    def _is_header_row(self, row: List[str]) -> bool:
+        """Check whether a row contains the actual column headers"""
         # Look for a row that contains expected column names
-        expected_columns = ['ID', 'Code', 'Name', 'Path', 'Level', 'Leaf']
-        
-        for i, row in enumerate(csv_data):
-            if all(col in row for col in expected_columns):
-                return i
-        
-        # Fallback to first row if no match found
-        return 0
+        return _HEADER_COLUMNS.issubset(row)
+
+    def _read_rows(self, csv_path: Path) -> Iterator[List[str]]:
+        """Yield CSV rows one at a time instead of loading the whole file"""
+        # Get delimiter from config, fallback to comma
+        delimiter = getattr(self.config, 'delimiter', ',')
+        try:
+            with open(csv_path, 'r', buffering=_READ_BUFFER_SIZE, encoding=self.config.csv_encoding) as f:
+                yield from csv.reader(f, delimiter=delimiter)
+        except Exception as e:
+            raise RuntimeError(f"Failed to read CSV file: {e}")
 
     def _validate_csv_structure(self, headers: List[str]) -> None:
         """Validate that required columns exist in CSV"""
-        required_columns = [
-            self.config.columns['leaf'],
-            self.config.columns['category_id'],
-            self.config.columns['path'],
-            self.config.columns['brand'],
-            self.config.columns['colour'],
-            self.config.columns['level']
-        ]
-        
-        # Add new required columns
-        new_columns = ['material', 'pattern', 'size', 'size_group', 'author', 'title', 'isbn', 
-                       'language_book', 'video_game_rating', 'video_game_platform', 
-                       'internal_memory_capacity', 'sim_lock']
-        for col in new_columns:
-            if col in self.config.columns:
-                required_columns.append(self.config.columns[col])
-        
-        # Add package_size column if it exists in config
-        if 'package_size' in self.config.columns:
-            required_columns.append(self.config.columns['package_size'])
-
-        missing_columns = [col for col in required_columns if col not in headers]
+        # Position of each header name; the first occurrence wins, as with list.index
+        header_positions = {}
+        for position, header in enumerate(headers):
+            header_positions.setdefault(header, position)
+
+        missing_columns = [col for col in self._required_columns if col not in header_positions]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
         # Store column indices for efficient access
-        for col_name in required_columns:
-            self._column_indices[col_name] = headers.index(col_name)
+        for col_name in self._required_columns:
+            self._column_indices[col_name] = header_positions[col_name]
 
         # Store condition column indices
         for condition in self.config.columns['conditions']:
-            if condition in headers:
-                self._column_indices[condition] = headers.index(condition)
+            if condition in header_positions:
+                self._column_indices[condition] = header_positions[condition]
             else:
-                logger.warning(f"Condition column '{condition}' not found in CSV")
+                logger.warning("Condition column '%s' not found in CSV", condition)
 
         # Store package size boolean column indices
-        package_size_columns = ['All shippable', 'Heavy shipping', 'Light bulky', 'Heavy bulky']
-        for col_name in package_size_columns:
-            if col_name in headers:
-                self._column_indices[col_name] = headers.index(col_name)
+        for col_name, _ in _PACKAGE_SIZE_COLUMNS:
+            if col_name in header_positions:
+                self._column_indices[col_name] = header_positions[col_name]
             else:
-                logger.warning(f"Package size column '{col_name}' not found in CSV")
-
-    def _extract_attributes(self, row: List[str]) -> CategoryAttributes:
-        """Extract category attributes from CSV row"""
-        brand_col = self.config.columns['brand']
-        colour_col = self.config.columns['colour']
-        material_col = self.config.columns['material']
-        pattern_col = self.config.columns.get('pattern', 'Pattern')
-        size_col = self.config.columns.get('size', 'Size')
-        size_group_col = self.config.columns['size_group']
-        author_col = self.config.columns['author']
-        title_col = self.config.columns['title']
-        isbn_col = self.config.columns['isbn']
-        language_book_col = self.config.columns.get('language_book', 'Language Book')
-        video_game_rating_col = self.config.columns.get('video_game_rating', 'Video Game Rating')
-        video_game_platform_col = self.config.columns.get('video_game_platform', 'Video Game Platform')
-        internal_memory_capacity_col = self.config.columns.get('internal_memory_capacity', 'Internal memory capacity')
-        sim_lock_col = self.config.columns.get('sim_lock', 'Sim Lock')
-
-        # Get column indices
-        brand_idx = self._column_indices.get(brand_col)
-        colour_idx = self._column_indices.get(colour_col)
-        material_idx = self._column_indices.get(material_col)
-        pattern_idx = self._column_indices.get(pattern_col)
-        size_idx = self._column_indices.get(size_col)
-        size_group_idx = self._column_indices.get(size_group_col)
-        author_idx = self._column_indices.get(author_col)
-        title_idx = self._column_indices.get(title_col)
-        isbn_idx = self._column_indices.get(isbn_col)
-        language_book_idx = self._column_indices.get(language_book_col)
-        video_game_rating_idx = self._column_indices.get(video_game_rating_col)
-        video_game_platform_idx = self._column_indices.get(video_game_platform_col)
-        internal_memory_capacity_idx = self._column_indices.get(internal_memory_capacity_col)
-        sim_lock_idx = self._column_indices.get(sim_lock_col)
-
-        # Extract values safely - empty values are treated as FALSE (None)
-        def safe_extract(idx, default=""):
-            return row[idx].strip() if idx is not None and idx < len(row) else default
-
-        brand_value = safe_extract(brand_idx)
-        colour_value = safe_extract(colour_idx)
-        material_value = safe_extract(material_idx)
-        pattern_value = safe_extract(pattern_idx)
-        size_value = safe_extract(size_idx)
-        size_group_value = safe_extract(size_group_idx)
-        author_value = safe_extract(author_idx)
-        title_value = safe_extract(title_idx)
-        isbn_value = safe_extract(isbn_idx)
-        language_book_value = safe_extract(language_book_idx)
-        video_game_rating_value = safe_extract(video_game_rating_idx)
-        video_game_platform_value = safe_extract(video_game_platform_idx)
-        internal_memory_capacity_value = safe_extract(internal_memory_capacity_idx)
-        sim_lock_value = safe_extract(sim_lock_idx)
-
-        # Helper function: empty string or missing = None (FALSE), TRUE/true/1 = True, anything else = FALSE
-        def parse_bool_value(value):
-            if value == '':
-                return None  # Empty means FALSE
-            elif value.upper() == 'TRUE' or value == '1':
-                return True
-            else:
-                return None  # Anything else is also treated as FALSE
-
-        return CategoryAttributes(
-            brand=True if brand_value == 'TRUE' else None if brand_value == '' else brand_value,
-            colour=True if colour_value == 'TRUE' else None if colour_value == '' else colour_value,
-            material=True if material_value == 'TRUE' else None if material_value == '' else material_value,
-            pattern=True if pattern_value == 'TRUE' else None if pattern_value == '' else pattern_value,
-            size=parse_bool_value(size_value),
-            size_group=True if size_group_value == 'TRUE' else None if size_group_value == '' else size_group_value,
-            author=True if author_value == 'TRUE' else None if author_value == '' else author_value,
-            title=True if title_value == 'TRUE' else None if title_value == '' else title_value,
-            isbn=True if isbn_value == 'TRUE' else None if isbn_value == '' else isbn_value,
-            language_book=parse_bool_value(language_book_value),
-            video_game_rating=parse_bool_value(video_game_rating_value),
-            video_game_platform=parse_bool_value(video_game_platform_value),
-            internal_memory_capacity=parse_bool_value(internal_memory_capacity_value),
-            sim_lock=parse_bool_value(sim_lock_value),
+                logger.warning("Package size column '%s' not found in CSV", col_name)
+
+        # Resolve the indices read on every row once, so the row loop
+        # doesn't repeat the config and index dict lookups
+        self._leaf_idx = self._column_indices[self.config.columns['leaf']]
+        self._category_id_idx = self._column_indices[self.config.columns['category_id']]
+        self._level_idx = self._column_indices[self.config.columns['level']]
+        self._path_idx = self._column_indices[self.config.columns['path']]
+        # (column index, condition bit) for each condition present in the CSV; bit i
+        # stands for the i-th configured condition
+        self._condition_bits = tuple(
+            (self._column_indices[condition], 1 << position)
+            for position, condition in enumerate(self.config.columns['conditions'])
+            if condition in self._column_indices
+        )
+        self._package_size_indices = tuple(
+            (self._column_indices.get(col_name), package_type)
+            for col_name, package_type in _PACKAGE_SIZE_COLUMNS
         )
-
-    def _extract_path(self, row: List[str]) -> str:
-        """Extract path from CSV row"""
-        path_col = self.config.columns['path']
-        path_idx = self._column_indices.get(path_col)
-        
-        if path_idx is None or path_idx >= len(row):
-            return ""
-        
-        return row[path_idx].strip()
-
-    def _extract_package_size(self, row: List[str]) -> str:
-        """Extract package size from CSV row by checking boolean columns first, then Package size column"""
-        # Check boolean package size columns in order of preference
-        package_size_columns = [
-            ('All shippable', 'All shippable'),
-            ('Heavy shipping', 'Heavy'),
-            ('Light bulky', 'Light bulky'),
-            ('Heavy bulky', 'Heavy bulky')
-        ]
-        
-        for col_name, package_type in package_size_columns:
-            col_idx = self._column_indices.get(col_name)
-            if col_idx is not None and col_idx < len(row):
-                value = row[col_idx].strip().upper()
-                if value == 'TRUE':
-                    return package_type
-        
-        # Fallback to the Package size column if no boolean columns are TRUE
         package_size_col = self.config.columns.get('package_size')
-        if package_size_col:
-            package_size_idx = self._column_indices.get(package_size_col)
-            if package_size_idx is not None and package_size_idx < len(row):
+        self._package_size_idx = self._column_indices.get(package_size_col) if package_size_col else None
+        self._default_shipping_sizes = self.config.package_size_mapping['All shippable']
+
+        # Attribute columns in CategoryAttributes field order, with the upload form
+        # and filter bits the field sets when TRUE; the bits are only non-zero when
+        # the field's column is configured and present, so a column read for both
+        # purposes is stripped once per row
+        attribute_indices = []
+        for field_name, default_column, is_flag in _ATTRIBUTE_COLUMNS:
+            upload_form_bit = filter_bit = 0
+            if self.config.columns.get(field_name) in self._column_indices:
+                mapping = _FIELD_MAPPINGS[field_name]
+                field_bit = 1 << FIELD_TYPE_NAMES.index(field_name)
+                upload_form_bit = field_bit if mapping['upload_form'] else 0
+                filter_bit = field_bit if mapping['filter'] else 0
+            attribute_indices.append((
+                self._column_indices.get(self.config.columns.get(field_name, default_column)),
+                is_flag,
+                upload_form_bit,
+                filter_bit,
+            ))
+        self._attribute_indices = tuple(attribute_indices)
+
+    def _extract_all(
+        self, row: List[str], row_len: int
+    ) -> Tuple[CategoryAttributes, int, int, str, int]:
+        """Extract attributes, field masks, package size and condition mask in one pass over the row"""
+        values = []
+        upload_form_mask = filter_mask = 0
+
+        for col_idx, is_flag, upload_form_bit, filter_bit in self._attribute_indices:
+            # Missing columns and empty values are treated as FALSE (None)
+            value = row[col_idx].strip() if col_idx is not None and col_idx < row_len else ''
+            # Already stripped, so only the case needs folding when the spelling is unusual
+            is_true = value in _TRUE_VALUES or (value not in _FALSE_VALUES and value.upper() == 'TRUE')
+            if is_flag:
+                # TRUE/true/1 = True, anything else = FALSE
+                values.append(True if is_true or value == '1' else None)
+            else:
+                # Kept text repeats across rows ('FALSE', 'x', ...), so share one copy
+                values.append(_ATTR_MAP[value] if value in _ATTR_MAP else sys.intern(value))
+
+            # Field type information for fields enabled (TRUE) in the CSV
+            if is_true:
+                upload_form_mask |= upload_form_bit
+                filter_mask |= filter_bit
+
+        # Package size: boolean columns in order of preference, then the Package size column
+        package_size = "All shippable"
+        for col_idx, package_type in self._package_size_indices:
+            if col_idx is not None and col_idx < row_len and _is_true(row[col_idx]):
+                package_size = package_type
+                break
+        else:
+            package_size_idx = self._package_size_idx
+            if package_size_idx is not None and package_size_idx < row_len:
                 package_size_value = row[package_size_idx].strip()
                 if package_size_value and package_size_value != '-':
-                    # Map the Package size column value to the correct package type
-                    if package_size_value == 'Light bulky':
-                        return 'Light bulky'
-                    elif package_size_value == 'Heavy':
-                        return 'Heavy'
-                    elif package_size_value == 'Heavy bulky':
-                        return 'Heavy bulky'
-                    elif package_size_value == 'All shippable':
-                        return 'All shippable'
-                    else:
-                        return package_size_value
-        
-        return "All shippable"
-
-    def _extract_status_counts(self, row: List[str]) -> Dict[str, int]:
-        """Extract status counts from CSV row"""
-        statuses_count = {}
+                    package_size = sys.intern(package_size_value)
 
-        for condition in self.config.columns['conditions']:
-            condition_idx = self._column_indices.get(condition)
-            if condition_idx is not None and condition_idx < len(row):
-                value = row[condition_idx].strip().upper()
-                statuses_count[condition] = 1 if value == 'TRUE' else 0
-            else:
-                statuses_count[condition] = 0
-
-        return statuses_count
-
-    def _extract_field_types(self, row: List[str]) -> Dict[str, FieldTypeInfo]:
-        """Extract field type information based on the field type row (row 3 in CSV)"""
-        field_types = {}
-        
-        # Field mappings based on the CSV structure
-        field_mappings = {
-            'brand': {'upload_form': True, 'filter': True},      # Upload Form + Filters
-            'colour': {'upload_form': True, 'filter': True},     # Upload Form + Filters  
-            'material': {'upload_form': True, 'filter': True},   # Upload Form + Filters
-            'pattern': {'upload_form': False, 'filter': True},   # Filters Only
-            'size': {'upload_form': True, 'filter': True},       # Upload Form + Filters
-            'size_group': {'upload_form': True, 'filter': True}, # Upload Form + Filters
-            'author': {'upload_form': True, 'filter': False},    # Upload Form Only
-            'title': {'upload_form': True, 'filter': False},     # Upload Form Only
-            'isbn': {'upload_form': True, 'filter': False},      # Upload Form Only
-            'language_book': {'upload_form': False, 'filter': True},  # Filters Only
-            'video_game_rating': {'upload_form': True, 'filter': True},  # Upload Form + Filters
-            'video_game_platform': {'upload_form': True, 'filter': True},  # Upload Form + Filters
-            'internal_memory_capacity': {'upload_form': True, 'filter': True},  # Upload Form + Filters
-            'sim_lock': {'upload_form': True, 'filter': True},  # Upload Form + Filters
-        }
-        
-        # Check if each field is enabled (TRUE) in the CSV
-        for field_name, mapping in field_mappings.items():
-            col_name = self.config.columns.get(field_name)
-            if col_name:
-                col_idx = self._column_indices.get(col_name)
-                if col_idx is not None and col_idx < len(row):
-                    value = row[col_idx].strip().upper()
-                    if value == 'TRUE':
-                        field_types[field_name] = FieldTypeInfo(
-                            field_name=field_name,
-                            is_upload_form=mapping['upload_form'],
-                            is_filter=mapping['filter']
-                        )
-        
-        return field_types
+        # Bitmask of the conditions flagged TRUE
+        condition_mask = 0
+        for condition_idx, bit in self._condition_bits:
+            if condition_idx < row_len and _is_true(row[condition_idx]):
+                condition_mask |= bit
+
+        return CategoryAttributes(*values), upload_form_mask, filter_mask, package_size, condition_mask
 
     def process_csv(self) -> List[CategoryData]:
         """Process CSV file and return structured category data"""
@@ -256,106 +250,101 @@ class CSVProcessor:
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        logger.info(f"Processing CSV file: {csv_path}")
-
-        try:
-            # Get delimiter from config, fallback to comma
-            delimiter = getattr(self.config, 'delimiter', ',')
-            with open(csv_path, 'r', encoding=self.config.csv_encoding) as f:
-                reader = csv.reader(f, delimiter=delimiter)
-                csv_data = list(reader)
-        except Exception as e:
-            raise RuntimeError(f"Failed to read CSV file: {e}")
-
-        if len(csv_data) < 2:
-            raise ValueError("CSV file must have at least a header row and one data row")
-
-        # Find the actual header row
-        header_row_index = self._find_header_row(csv_data)
-        headers = csv_data[header_row_index]
-        self._validate_csv_structure(headers)
-
-        logger.info(f"CSV structure validated. Header row: {header_row_index + 1}. Total rows: {len(csv_data)}")
-
-        categories = []
-        total_count = 0
-
-        # Start processing from the row after the header
-        for row_index, row in enumerate(csv_data[header_row_index + 1:], header_row_index + 1):
-            try:
-                category_data = self._process_row(row, row_index)
-                if category_data:
-                    categories.append(category_data)
-                    total_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to process row {row_index}: {e}")
-                continue
-
-        logger.info(f"Successfully processed {total_count} categories (including both leaf and non-leaf)")
+        logger.info("Processing CSV file: %s", csv_path)
+
+        with closing(self._read_rows(csv_path)) as rows:
+            # Only the rows up to the header are buffered; data rows are streamed
+            buffered_rows = []
+            header_row_index = None
+            for row in rows:
+                buffered_rows.append(row)
+                if self._is_header_row(row):
+                    header_row_index = len(buffered_rows) - 1
+                    break
+
+            if header_row_index == 0:
+                next_row = next(rows, None)
+                if next_row is not None:
+                    buffered_rows.append(next_row)
+
+            if len(buffered_rows) < 2:
+                raise ValueError("CSV file must have at least a header row and one data row")
+
+            if header_row_index is None:
+                # Fallback to first row if no match found
+                header_row_index = 0
+
+            headers = buffered_rows[header_row_index]
+            self._validate_csv_structure(headers)
+
+            logger.info("CSV structure validated. Header row: %d", header_row_index + 1)
+
+            # Start processing from the row after the header; rows that can't be
+            # processed come back as None and are dropped
+            data_rows = chain(buffered_rows[header_row_index + 1:], rows)
+            categories = [
+                category_data
+                for category_data in map(self._process_row, data_rows, count(header_row_index + 1))
+                if category_data is not None
+            ]
+
+        logger.info("Successfully processed %d categories (including both leaf and non-leaf)", len(categories))
         return categories
 
     def _process_row(self, row: List[str], row_index: int) -> Optional[CategoryData]:
         """Process a single CSV row"""
+        row_len = len(row)
+
         # Extract the Leaf value for the data model (but don't filter by it)
-        leaf_col = self.config.columns['leaf']
-        leaf_idx = self._column_indices[leaf_col]
+        leaf_idx = self._leaf_idx
 
-        if leaf_idx >= len(row):
-            logger.warning(f"Row {row_index}: Leaf column out of bounds")
+        if leaf_idx >= row_len:
+            logger.warning("Row %d: Leaf column out of bounds", row_index)
             return None
 
         # Extract the actual Leaf value for the data model
-        leaf_value = row[leaf_idx].strip().upper() == 'TRUE'
+        leaf_value = _is_true(row[leaf_idx])
 
         # Extract category ID
-        category_id_col = self.config.columns['category_id']
-        category_id_idx = self._column_indices[category_id_col]
+        category_id_idx = self._category_id_idx
 
-        if category_id_idx >= len(row):
-            logger.warning(f"Row {row_index}: Category ID column out of bounds")
+        if category_id_idx >= row_len:
+            logger.warning("Row %d: Category ID column out of bounds", row_index)
             return None
 
-        try:
-            category_id = int(row[category_id_idx].strip())
-        except ValueError:
-            logger.warning(f"Row {row_index}: Invalid category ID '{row[category_id_idx]}'")
+        category_id = _try_int(row[category_id_idx])
+        if category_id is None:
+            logger.warning("Row %d: Invalid category ID '%s'", row_index, row[category_id_idx])
             return None
 
         # Extract category level
-        level_col = self.config.columns['level']
-        level_idx = self._column_indices[level_col]
+        level_idx = self._level_idx
 
-        if level_idx >= len(row):
-            logger.warning(f"Row {row_index}: Level column out of bounds")
+        if level_idx >= row_len:
+            logger.warning("Row %d: Level column out of bounds", row_index)
             return None
 
-        try:
-            category_level = int(row[level_idx].strip())
-        except ValueError:
-            logger.warning(f"Row {row_index}: Invalid level '{row[level_idx]}'")
+        category_level = _try_int(row[level_idx])
+        if category_level is None:
+            logger.warning("Row %d: Invalid level '%s'", row_index, row[level_idx])
             return None
 
         # Extract all data
-        path = self._extract_path(row)
-        attributes = self._extract_attributes(row)
-        field_types = self._extract_field_types(row)
-        package_size = self._extract_package_size(row)
-        statuses_count = self._extract_status_counts(row)
+        path = row[self._path_idx].strip() if self._path_idx < row_len else ""
+        attributes, upload_form_mask, filter_mask, package_size, condition_mask = self._extract_all(row, row_len)
 
         # Map package size to shipping IDs
-        shipping_sizes = self.config.package_size_mapping.get(
-            package_size,
-            self.config.package_size_mapping['All shippable']
-        )
+        shipping_sizes = self.config.package_size_mapping.get(package_size, self._default_shipping_sizes)
 
         return CategoryData(
             category_id=category_id,
             is_leaf_category=leaf_value,  # Add the Leaf column value
             path=path,  # Add the path value
             attributes=attributes,
-            field_types=field_types,  # Add field type information
+            upload_form_mask=upload_form_mask,  # Add field type information
+            filter_mask=filter_mask,
             package_size=package_size,
             shipping_sizes=shipping_sizes,
-            statuses_count=statuses_count,
+            condition_mask=condition_mask,
             category_level=category_level
         )
\ No newline at end of file
@@ -1,81 +1,129 @@
 # kotlin_generator.py
 import logging
+import os
+import re
 from pathlib import Path
-from typing import List, Dict
-from models import CategoryData, Config
+from typing import List, Dict, Iterator
+from models import CategoryData, Config, FIELD_TYPE_NAMES
 
 logger = logging.getLogger(__name__)
 
+# Characters that must be escaped inside a Kotlin string literal; '$' would
+# otherwise start a string template
+_KT_ESC = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '$': '\\$',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+# Most paths need no escaping; a regex search is much cheaper than a
+# translate call that maps every character through the table
+_KT_ESC_RE = re.compile(r'[\\"$\n\r\t]')
+
+
+def _kt_str(value: str) -> str:
+    """Escape a value for embedding in a double-quoted Kotlin string"""
+    return value.translate(_KT_ESC) if _KT_ESC_RE.search(value) else value
+
+
+# Large write buffer so the generated entries reach disk in few system calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Condition IDs used when a category has no condition flagged, in sorted order
+_DEFAULT_CONDITION_IDS = tuple(sorted((
+    'VintedConditionTypes.NEW_WITH_TAGS.id',
+    'VintedConditionTypes.NEW_WITHOUT_TAGS.id',
+    'VintedConditionTypes.VERY_GOOD.id',
+    'VintedConditionTypes.GOOD.id',
+    'VintedConditionTypes.SATISFACTORY.id'
+)))
+
+# Kotlin symbol each upload-form field makes visible; fields not listed add nothing
+_UPLOAD_FORM_SYMBOLS = {
+    'brand': 'VintedUploadItemFieldTypes.BRAND_VISIBLE',
+    'colour': 'VintedUploadItemFieldTypes.COLOR_VISIBLE',
+    'material': 'VintedUploadItemFieldTypes.MATERIAL_VISIBLE',
+    'pattern': 'VintedUploadItemFieldTypes.PATTERN_VISIBLE',
+    'size': 'VintedUploadItemFieldTypes.SIZE_VISIBLE',
+    'size_group': 'VintedUploadItemFieldTypes.SIZE_VISIBLE',
+    'author': 'VintedUploadItemFieldTypes.AUTHOR_VISIBLE',
+    'isbn': 'VintedUploadItemFieldTypes.ISBN_VISIBLE',
+    'video_game_rating': 'VintedUploadItemFieldTypes.VIDEO_GAME_RATING_VISIBLE',
+    'video_game_platform': 'VintedUploadItemFieldTypes.VIDEO_GAME_PLATFORM_VISIBLE',
+    'internal_memory_capacity': 'VintedUploadItemFieldTypes.STORAGE_VISIBLE',
+    'sim_lock': 'VintedUploadItemFieldTypes.SIM_LOCK_VISIBLE',
+}
+
+# Kotlin filter each filterable field enables; fields not listed add nothing
+_FILTER_SYMBOLS = {
+    'brand': 'VintedFilterType.BRAND',
+    'colour': 'VintedFilterType.COLOR',
+    'material': 'VintedFilterType.MATERIAL',
+    'pattern': 'VintedFilterType.PATTERNS',
+    'size': 'VintedFilterType.SIZE',
+    # Note: size_group does NOT add SIZE filter - only the 'size' field does
+    'language_book': 'VintedFilterType.LANGUAGE',
+    'video_game_rating': 'VintedFilterType.VIDEO_GAME_RATING',
+    'video_game_platform': 'VintedFilterType.VIDEO_GAME_PLATFORM',
+    'internal_memory_capacity': 'VintedFilterType.INTERNAL_MEMORY_CAPACITY',
+    'sim_lock': 'VintedFilterType.SIM_LOCK',
+}
+
+# (field bit, symbol) pairs in output order, for the fields that have a symbol
+_UPLOAD_FORM_BITS = tuple(
+    (1 << position, _UPLOAD_FORM_SYMBOLS[field_name])
+    for position, field_name in enumerate(FIELD_TYPE_NAMES)
+    if field_name in _UPLOAD_FORM_SYMBOLS
+)
+_FILTER_BITS = tuple(
+    (1 << position, _FILTER_SYMBOLS[field_name])
+    for position, field_name in enumerate(FIELD_TYPE_NAMES)
+    if field_name in _FILTER_SYMBOLS
+)
+
+# CategoryLevel enum indexed by numeric level (1-7); deeper levels fall back to CategoryLevel.L<n>
+_LEVEL_ENUMS = (
+    None,
+    "CategoryLevel.ROOT_CATEGORY",
+    "CategoryLevel.L2",
+    "CategoryLevel.L3",
+    "CategoryLevel.L4",
+    "CategoryLevel.L5",
+    "CategoryLevel.L6",
+    "CategoryLevel.L7",
+)
+
 
 class KotlinGenerator:
     def __init__(self, config: Config):
         self.config = config
-
-    def _generate_field_types(self, field_types: Dict[str, 'FieldTypeInfo']) -> List[str]:
+        # (condition bit, condition ID) for every mapped condition, ordered by ID
+        # so matches come out already sorted
+        self._sorted_condition_ids = sorted(
+            (
+                (1 << position, config.condition_mapping[condition])
+                for position, condition in enumerate(config.columns['conditions'])
+                if condition in config.condition_mapping
+            ),
+            key=lambda item: item[1]
+        )
+
+    def _generate_field_types(self, upload_form_mask: int) -> List[str]:
         """Generate field types based on field type information"""
-        upload_form_fields = []
-
         # Only include fields that are enabled for upload form
-        for field_name, field_info in field_types.items():
-            if field_info.is_upload_form:
-                if field_name == 'brand':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.BRAND_VISIBLE')
-                elif field_name == 'colour':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.COLOR_VISIBLE')
-                elif field_name == 'material':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.MATERIAL_VISIBLE')
-                elif field_name == 'pattern':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.PATTERN_VISIBLE')
-                elif field_name == 'size':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.SIZE_VISIBLE')
-                elif field_name == 'size_group':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.SIZE_VISIBLE')
-                elif field_name == 'author':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.AUTHOR_VISIBLE')
-                elif field_name == 'isbn':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.ISBN_VISIBLE')
-                elif field_name == 'video_game_rating':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.VIDEO_GAME_RATING_VISIBLE')
-                elif field_name == 'video_game_platform':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.VIDEO_GAME_PLATFORM_VISIBLE')
-                elif field_name == 'internal_memory_capacity':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.STORAGE_VISIBLE')
-                elif field_name == 'sim_lock':
-                    upload_form_fields.append('VintedUploadItemFieldTypes.SIM_LOCK_VISIBLE')
+        upload_form_fields = [symbol for bit, symbol in _UPLOAD_FORM_BITS if upload_form_mask & bit]
 
         # Always include condition field as it's always present
         upload_form_fields.append('VintedUploadItemFieldTypes.CONDITION_VISIBLE')
 
         return upload_form_fields
 
-    def _generate_filter_types(self, field_types: Dict[str, 'FieldTypeInfo']) -> List[str]:
+    def _generate_filter_types(self, filter_mask: int) -> List[str]:
         """Generate filter types based on field type information"""
-        filter_fields = []
-
         # Only include fields that are enabled for filters
-        for field_name, field_info in field_types.items():
-            if field_info.is_filter:
-                if field_name == 'brand':
-                    filter_fields.append('VintedFilterType.BRAND')
-                elif field_name == 'colour':
-                    filter_fields.append('VintedFilterType.COLOR')
-                elif field_name == 'material':
-                    filter_fields.append('VintedFilterType.MATERIAL')
-                elif field_name == 'pattern':
-                    filter_fields.append('VintedFilterType.PATTERNS')
-                elif field_name == 'size':
-                    filter_fields.append('VintedFilterType.SIZE')
-                # Note: size_group does NOT add SIZE filter - only the 'size' field does
-                elif field_name == 'language_book':
-                    filter_fields.append('VintedFilterType.LANGUAGE')
-                elif field_name == 'video_game_rating':
-                    filter_fields.append('VintedFilterType.VIDEO_GAME_RATING')
-                elif field_name == 'video_game_platform':
-                    filter_fields.append('VintedFilterType.VIDEO_GAME_PLATFORM')
-                elif field_name == 'internal_memory_capacity':
-                    filter_fields.append('VintedFilterType.INTERNAL_MEMORY_CAPACITY')
-                elif field_name == 'sim_lock':
-                    filter_fields.append('VintedFilterType.SIM_LOCK')
+        filter_fields = [symbol for bit, symbol in _FILTER_BITS if filter_mask & bit]
 
         # Always include condition filter since condition is always visible in upload form
         filter_fields.append('VintedFilterType.STATUS')
@@ -85,30 +133,23 @@ class KotlinGenerator:
 
         return filter_fields
 
-    def _generate_condition_ids(self, statuses_count: Dict[str, int]) -> List[str]:
-        """Generate condition IDs based on available statuses"""
-        condition_ids = []
-
-        for status, count in statuses_count.items():
-            if count > 0 and status in self.config.condition_mapping:
-                condition_ids.append(self.config.condition_mapping[status])
+    def _generate_condition_ids(self, condition_mask: int) -> List[str]:
+        """Generate condition IDs based on the flagged conditions"""
+        # Bit i of condition_mask is the i-th configured condition
+        condition_ids = [
+            condition_id
+            for bit, condition_id in self._sorted_condition_ids
+            if condition_mask & bit
+        ]
 
         # If no specific conditions found, use default conditions
         if not condition_ids:
-            condition_ids = [
-                'VintedConditionTypes.NEW_WITH_TAGS.id',
-                'VintedConditionTypes.NEW_WITHOUT_TAGS.id',
-                'VintedConditionTypes.VERY_GOOD.id',
-                'VintedConditionTypes.GOOD.id',
-                'VintedConditionTypes.SATISFACTORY.id'
-            ]
+            condition_ids = list(_DEFAULT_CONDITION_IDS)
 
-        return sorted(condition_ids)
+        return condition_ids
 
-    def generate_kotlin_models(self, categories: List[CategoryData]) -> str:
-        """Generate Kotlin CategoryLaunchDataProviderModel entries"""
-        lines = []
-        
+    def iter_kotlin_models(self, categories: List[CategoryData]) -> Iterator[str]:
+        """Yield the Kotlin file piece by piece: header, each entry with its separator, footer"""
         # Add header
         header = """package categoryLaunches.dataProviders
 
@@ -129,71 +170,79 @@ class CategoryLaunchDataProvider {
     @DataProvider(name = "dataForCategoryLaunches", parallel = true)
     fun getDataForEachCategory(): Array<CategoryLaunchDataProviderModel> {
         return arrayOf("""
-        lines.append(header)
+        yield header
+
+        # Entries are separated by a blank line, with none before the footer
+        separator = '\n'
+
+        # Entries share a handful of field, condition and shipping combinations,
+        # so the middle of the entry is rendered once per distinct signature and
+        # only the per-category scalars are formatted for every entry
+        signature_fragments: Dict[tuple, str] = {}
 
         for category in categories:
-            upload_form_fields = self._generate_field_types(category.field_types)
-            filter_fields = self._generate_filter_types(category.field_types)
-            condition_ids = self._generate_condition_ids(category.statuses_count)
-
-            # Format strings
-            upload_form_fields_str = "listOf(" + ", ".join(upload_form_fields) + ")"
-            filter_fields_str = "listOf(" + ", ".join(filter_fields) + ")" if filter_fields else "emptyList()"
-            condition_ids_str = "setOf(" + ", ".join(condition_ids) + ")"
-            shipping_sizes_str = "setOf(" + ", ".join(category.shipping_sizes) + ")"
-
-            entry = f"""CategoryLaunchDataProviderModel(
-    categoryId = {category.category_id}L,
-    isLeafCategory = {str(category.is_leaf_category).lower()},
-    categoryLevel = {category.category_level}L,
-    categoryPath = "{category.path}",
-    expectedFieldsVisibility = {upload_form_fields_str},
+            signature = (
+                category.upload_form_mask,
+                category.filter_mask,
+                category.condition_mask,
+                tuple(category.shipping_sizes),
+            )
+            signature_str = signature_fragments.get(signature)
+            if signature_str is None:
+                upload_form_fields = self._generate_field_types(category.upload_form_mask)
+                filter_fields = self._generate_filter_types(category.filter_mask)
+                condition_ids = self._generate_condition_ids(category.condition_mask)
+                filter_fields_str = f"listOf({', '.join(filter_fields)})" if filter_fields else "emptyList()"
+                signature_str = f"""
+    expectedFieldsVisibility = listOf({', '.join(upload_form_fields)}),
     expectedFiltersVisibility = {filter_fields_str},
-    expectedConditionTypeIds = {condition_ids_str},
-    expectedPackageSizeIds = {shipping_sizes_str},
+    expectedConditionTypeIds = setOf({', '.join(condition_ids)}),
+    expectedPackageSizeIds = setOf({', '.join(category.shipping_sizes)}),"""
+                signature_fragments[signature] = signature_str
+
+            yield separator
+            separator = '\n\n'
+            yield f"""CategoryLaunchDataProviderModel(
+    categoryId = {category.category_id_str}L,
+    isLeafCategory = {'true' if category.is_leaf_category else 'false'},
+    categoryLevel = {category.category_level_str}L,
+    categoryPath = "{_kt_str(category.path)}",{signature_str}
     expectedSizeGroupsIds = null,
-    brandId = supplyTestsHelper.getDefaultBrandId({category.category_id}L)
+    brandId = supplyTestsHelper.getDefaultBrandId({category.category_id_str}L)
 ),"""
 
-            lines.append(entry)
-            lines.append("")
-
-        # Remove the last blank line before adding footer
-        if lines and lines[-1] == "":
-            lines.pop()
-        
         # Add footer
         footer = """        )
     }
 }"""
-        lines.append(footer)
+        yield '\n'
+        yield footer
 
-        return '\n'.join(lines)
+    def generate_kotlin_models(self, categories: List[CategoryData]) -> str:
+        """Generate Kotlin CategoryLaunchDataProviderModel entries"""
+        return ''.join(self.iter_kotlin_models(categories))
 
     def _get_level_enum(self, level: int) -> str:
         """Convert numeric level to CategoryLevel enum reference"""
-        level_mapping = {
-            1: "CategoryLevel.ROOT_CATEGORY",
-            2: "CategoryLevel.L2",
-            3: "CategoryLevel.L3",
-            4: "CategoryLevel.L4",
-            5: "CategoryLevel.L5",
-            6: "CategoryLevel.L6",
-            7: "CategoryLevel.L7"
-        }
-        
-        return level_mapping.get(level, f"CategoryLevel.L{level}")
+        return _LEVEL_ENUMS[level] if 1 <= level < len(_LEVEL_ENUMS) else f"CategoryLevel.L{level}"
 
     def save_kotlin_file(self, categories: List[CategoryData], output_path: str) -> None:
         """Generate and save Kotlin file"""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        kotlin_content = self.generate_kotlin_models(categories)
-
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(kotlin_content)
+            # Entries are written as they are generated instead of building the whole
+            # file first; they go to a sibling temp file that replaces the output only
+            # once complete, so a failure part way leaves the previous file intact
+            temp_file = output_file.with_name(f'{output_file.name}.{os.getpid()}.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.writelines(self.iter_kotlin_models(categories))
+                os.replace(temp_file, output_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
             logger.info(f"Kotlin file saved: {output_file}")
         except Exception as e:
             raise RuntimeError(f"Failed to save Kotlin file: {e}")
\ No newline at end of file
@@ -1,5 +1,8 @@
 # main.py
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import List
@@ -12,14 +15,28 @@ from models import CategoryData, Config
 
 def setup_logging() -> None:
     """Setup logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('category_processor.log')
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # The log file is only opened on the first record it takes, and it keeps
+    # warnings and errors only; per-run progress stays on the console
+    file_handler = logging.FileHandler('category_processor.log', delay=True)
+    file_handler.setLevel(logging.WARNING)
+    handlers = [logging.StreamHandler(sys.stdout), file_handler]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Log calls only enqueue the record; a background listener thread does the
+    # console and file writes, and is stopped (flushing the queue) at exit
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The queue handler only merges the message arguments; the listener's
+    # handlers apply the full format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 
 def main():
@@ -12,6 +12,9 @@ class FieldType(Enum):
 
 @dataclass
 class CategoryAttributes:
+    __slots__ = ('brand', 'colour', 'material', 'pattern', 'size', 'size_group', 'author', 'title', 'isbn',
+                 'language_book', 'video_game_rating', 'video_game_platform', 'internal_memory_capacity', 'sim_lock')
+
     brand: Optional[bool]
     colour: Optional[bool]
     material: Optional[bool]
@@ -27,26 +30,36 @@ class CategoryAttributes:
     internal_memory_capacity: Optional[bool]
     sim_lock: Optional[bool]
 
-@dataclass
-class FieldTypeInfo:
-    """Information about field type (Upload Form + Filters, Upload Form Only, Filters Only)"""
-    field_name: str
-    is_upload_form: bool
-    is_filter: bool
+# Fields tracked per category for upload form and filter visibility, in output
+# order; bit i of CategoryData's field masks stands for FIELD_TYPE_NAMES[i]
+FIELD_TYPE_NAMES = (
+    'brand', 'colour', 'material', 'pattern', 'size', 'size_group', 'author', 'title', 'isbn',
+    'language_book', 'video_game_rating', 'video_game_platform', 'internal_memory_capacity', 'sim_lock',
+)
 
 @dataclass
 class CategoryData:
+    __slots__ = ('category_id', 'is_leaf_category', 'path', 'attributes', 'upload_form_mask', 'filter_mask',
+                 'package_size', 'shipping_sizes', 'condition_mask', 'category_level', 'category_id_str', 'category_level_str')
+
     category_id: str
     is_leaf_category: bool  # Add this field to match the new Kotlin model
     path: str  # Add path field for category hierarchy
     attributes: CategoryAttributes
-    field_types: Dict[str, FieldTypeInfo]  # Field type information (Upload Form + Filters, etc.)
+    upload_form_mask: int  # Bitmask of fields enabled on the upload form, see FIELD_TYPE_NAMES
+    filter_mask: int  # Bitmask of fields enabled as filters, see FIELD_TYPE_NAMES
     package_size: str
     shipping_sizes: List[str]
-    statuses_count: Dict[str, int]
+    condition_mask: int  # Bitmask of flagged conditions; bit i is the i-th configured condition
     category_level: int
 
-@dataclass
+    def __post_init__(self):
+        # String forms for the Kotlin output, converted once per category; plain
+        # slots rather than dataclass fields, so they stay out of __init__ and repr
+        self.category_id_str = str(self.category_id)
+        self.category_level_str = str(self.category_level)
+
+@dataclass(frozen=True)
 class Config:
     csv_file_path: str
     csv_encoding: str